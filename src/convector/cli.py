@@ -1,8 +1,7 @@
+import os
+import stat
 import click
-import yaml
 import logging
-import re
-import logging.config
 from pathlib import Path
 from typing import Optional, List
 
@@ -12,10 +11,11 @@ from convector.core.directory_processor import DirectoryProcessor
 from convector.core.profile import Profile, FilterCondition
 from convector.core.convector_config import ConvectorConfig
 from convector.core.user_interaction import UserInteraction
+from convector.utils.label_filter import split_condition
+from convector.utils.config_utils import setup_logging
 from .convector import Convector
 
 
-PERSISTENT_CONFIG_PATH = Path.home() / '.convector_config'
 
 class ConfigurationError(Exception):
     """Exception raised for errors in the configuration."""
@@ -25,25 +25,6 @@ class ProcessingError(Exception):
     """Exception raised during processing of the conversational data."""
     pass
 
-def setup_logging(default_path: str = None, default_level=logging.INFO):
-    """Setup logging configuration from a YAML file."""
-    if default_path is None:
-        if PERSISTENT_CONFIG_PATH.exists():
-            with open(PERSISTENT_CONFIG_PATH, 'r') as file:
-                convector_root_dir = file.read().strip()
-                default_path = Path(convector_root_dir) / 'config.yaml'
-        else:
-            config = ConvectorConfig()
-            default_path = Path(config.convector_root_dir) / 'config.yaml'
-    
-    try:
-        with open(default_path, 'rt') as file:
-            config = yaml.safe_load(file)
-            logging.config.dictConfig(config)
-    except FileNotFoundError:
-        logging.warning(f"Logging configuration file is not found at '{default_path}'. Using default configs.")
-        logging.basicConfig(level=default_level)
-
 class ConvectorFactory:
     @staticmethod
     def create_from_profile(profile: Profile, file_path):
@@ -67,12 +48,27 @@ class DirectoryProcessorFactory:
 def echo_info(message: str) -> None:
     click.echo(click.style(message, fg='green'))
 
+def detect_path_type(path: Path) -> str:
+    """
+    Tells whether a path is a 'file', a 'folder' or 'unknown', with a single stat call.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return 'unknown'
+    if stat.S_ISREG(mode):
+        return 'file'
+    if stat.S_ISDIR(mode):
+        return 'folder'
+    return 'unknown'
+
 def process_conversational_data(file_path: Path, profile: Profile) -> None:
-    if file_path.is_dir():
+    path_type = detect_path_type(file_path)
+    if path_type == 'folder':
         directory_processor = DirectoryProcessorFactory.create_from_profile(profile, file_path)
         directory_processor.process_directory()
         directory_processor.print_summary()
-    elif file_path.is_file():
+    elif path_type == 'file':
         UserInteraction.show_message(f"Processing file: {file_path}")
         convector = Convector(profile, UserInteraction(), file_path)
         convector.process()
@@ -85,9 +81,9 @@ def parse_filter_conditions(filter_conditions: str) -> List[FilterCondition]:
     """
     filter_objs = []
     for condition in filter_conditions.split(';'):
-        match = re.match(r"([\w\.]+)(!=|==|=|<|>|<=>)?(.*)", condition.strip())
-        if match:
-            field, operator, value = match.groups()
+        parts = split_condition(condition.strip())
+        if parts:
+            field, operator, value = parts
             filter_objs.append(FilterCondition(field=field, operator=operator, value=value))
     return filter_objs
 
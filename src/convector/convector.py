@@ -1,5 +1,4 @@
 # convector.py
-import json
 import os
 import logging
 from tqdm import tqdm
@@ -11,6 +10,7 @@ from convector.utils.output_schema_handler import OutputSchemaHandler
 from convector.core.base_file_handler import BaseFileHandler
 from convector.core.profile import Profile, FilterCondition
 from convector.utils.label_filter import LabelFilter
+from convector.utils.json_utils import dumps
 
 logging.basicConfig(level=logging.INFO)
 
@@ -51,39 +51,37 @@ class DataTransformer:
         self.file_handler = file_handler
 
     def transform_item(self, item):
-        processed_item = self.file_handler.transform_data(item)
-
-        if not processed_item or not any(processed_item):  # Check if filtered_items is empty or contains empty dicts
-            return []  # Return empty list if no items to process
-
-        transformed_items = []
-        for item in processed_item:
-            if self.output_schema_handler is not None:
-                transformed_item = self.output_schema_handler.apply_schema(item)
-            else:
-                transformed_item = item
-            transformed_items.append(transformed_item)
-
-        return transformed_items
+        """
+        Applies the output schema to an item already transformed by the file handler.
+        """
+        if self.output_schema_handler is not None:
+            # The file handlers only produce dictionaries
+            return self.output_schema_handler.apply_schema(item, validate=False)
+        return item
 
 class FileWriter:
+    buffer_size = 1024  # Number of serialized items written to the file at once
+
     def __init__(self, output_file_path, mode='a', source=None):
         self.output_file_path = output_file_path
         self.mode = mode
         self.source = source  # The origin file name
         self.buffer = []
+        self.bytes_written = 0
 
     def write_item(self, item):
         item_with_origin = item.copy()  # Copy the item
         item_with_origin['origin'] = self.source  # Add the 'source' field
-        self.buffer.append(json.dumps(item_with_origin, ensure_ascii=False) + '\n')
-        if len(self.buffer) >= 100:
+        self.buffer.append(dumps(item_with_origin))  # Serialized straight to UTF-8 bytes
+        if len(self.buffer) >= self.buffer_size:
             self.flush()
 
     def flush(self):
-        with open(self.output_file_path, self.mode, encoding='utf-8') as file:
-            file.writelines(self.buffer)
+        payload = b'\n'.join(self.buffer) + b'\n'
+        with open(self.output_file_path, self.mode + 'b') as file:
+            file.write(payload)
             self.mode = 'a'  # After the first write, always append
+        self.bytes_written += len(payload)
         self.buffer.clear()
 
     def close(self):
@@ -100,38 +98,23 @@ class DataSaver:
 
     def save_data(self, transformed_data_generator, total_lines, bytes, append):
         lines_written = 0
-        total_bytes_written = 0
 
         with managed_progress_bar(total_lines or 0) as progress_bar:
-            for items in transformed_data_generator:
-                # Check if items is a list and iterate through each item if so
-                if isinstance(items, list):
-                    for item in items:
-                        transformed_item = self.data_transformer.transform_item(item)
-
-                        if isinstance(transformed_item, dict):
-                            self.file_writer.write_item(transformed_item)
-                        else:
-                            for single_item in transformed_item:
-                                self.file_writer.write_item(single_item)
-
-                        lines_written += 1
-                        progress_bar.update(1)
-
-                        if total_lines and lines_written >= total_lines:
-                            break
-                else:
-                    transformed_item = self.data_transformer.transform_item(items)
+            # The file handler streams transformed items one at a time
+            for item in transformed_data_generator:
+                if not item:  # Skip empty items
+                    continue
 
-                    self.file_writer.write_item(transformed_item)
+                self.file_writer.write_item(self.data_transformer.transform_item(item))
 
-                    lines_written += 1
-                    progress_bar.update(1)
+                lines_written += 1
+                progress_bar.update(1)
 
-                    if total_lines and lines_written >= total_lines:
-                        break
+                if total_lines and lines_written >= total_lines:
+                    break
         
         self.file_writer.close() # Ensure the buffer is flushed at the end
+        return lines_written, self.file_writer.bytes_written
     
 @contextmanager
 def managed_progress_bar(total_lines):
@@ -165,12 +148,13 @@ class ProcessingOrchestrator:
             output_file_path, 
             self.data_transformer
         )
-        data_saver.save_data(
+        lines_written, total_bytes_written = data_saver.save_data(
             transformed_data_generator,
             total_lines=self.profile.lines,
             bytes=self.profile.bytes,
             append=self.profile.append
         )
+        self.file_handler_module.display_results(output_file_path, lines_written, total_bytes_written)
         
 
 class Convector:
@@ -1,7 +1,10 @@
 # base_file_handler.py
 
-import json
+import gc
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
 from typing import Generator, Dict, Any, Iterator
 import logging
 
@@ -9,10 +12,28 @@ from ..data_processors.data_processors import IDataProcessor, ConversationDataPr
 from ..utils.random_selector import LineRandomSelector, ByteRandomSelector, ConversationRandomSelector
 from convector.core.profile import Profile
 from convector.utils.label_filter import LabelFilter
+from convector.utils.json_utils import loads, dumped_size
 
 logging.basicConfig(level=logging.DEBUG)
 
+@contextmanager
+def paused_gc():
+    """
+    Disables the cyclic garbage collector during bulk loops, which only build acyclic
+    dicts and lists, and runs a single collection at the end instead.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.collect()
+            gc.enable()
+
 class BaseFileHandler(ABC):
+    batch_size = 1024  # Number of lines decoded and filtered together
+
     def __init__(self, file_path: str, profile: Profile):
         self.initialize_handler(file_path, profile)
 
@@ -30,21 +51,30 @@ class BaseFileHandler(ABC):
         self.lines = profile.lines
         self.bytes = profile.bytes
         self.random_selection = profile.random
+        # Resolved once here so the per-row path does not repeat the dispatch
+        self.fields_to_include = [condition.field for condition in self.filters]
         self.data_processor: IDataProcessor = None
-       
+        self.choose_data_processor()
 
     def filter_lines(self, lines: Iterator) -> Iterator:
         """
         Filters lines based on random selection or line limits.
         """
-        selected_positions = self.determine_selected_positions(lines)
-        for i, line in enumerate(lines):
-            if self.is_selected_line(i, selected_positions):
-                yield line
+        selected_lines = self.determine_selected_lines(lines)
+        if selected_lines is None:
+            # Without random selection only the first `lines` lines are kept
+            yield from islice(lines, self.lines)
+        elif self.is_conversation:
+            # Conversations are selected whole, their messages are processed one by one
+            for conversation in selected_lines:
+                yield from conversation
+        else:
+            yield from selected_lines
 
-    def determine_selected_positions(self, lines: Iterator) -> Any:
+    def determine_selected_lines(self, lines: Iterator) -> Any:
         """
-        Determines which lines should be selected based on random selection or line limits.
+        Selects lines at random when random selection is enabled. The selectors read the
+        lines in a single pass and return the selected ones, in file order.
         """
         if self.random_selection:
             return self.random_selector(
@@ -55,14 +85,6 @@ class BaseFileHandler(ABC):
             )
         return None
 
-    def is_selected_line(self, index: int, selected_positions: Any) -> bool:
-        """
-        Determines if a line at a given index is selected for processing.
-        """
-        if self.lines is not None and index >= self.lines:
-            return False
-        return selected_positions is None or index in selected_positions
-
     @abstractmethod
     def read_file(self) -> Iterator:
         """
@@ -94,30 +116,40 @@ class BaseFileHandler(ABC):
 
     def process_lines(self) -> Generator[Dict[str, Any], None, None]:
         total_bytes = 0
-        filtered_lines = self.filter_lines(self.read_file())
+        filtered_lines = iter(self.filter_lines(self.read_file()))
         label_filter = LabelFilter(self.filters)  # Initialize the LabelFilter with filters from profile
 
-        for line in filtered_lines:
-            processed_line = json.loads(line) if isinstance(line, str) else line  # Check if line is a string
+        # Bound once so the per-line loop only touches locals
+        apply_filters = label_filter.apply_filters
+        process_single_line = self.process_single_line
+        check_bytes = self.bytes is not None
+        batch_size = self.batch_size
+
+        with paused_gc():
+            while True:
+                # Lines are decoded and filtered a batch at a time rather than one list per line
+                batch = [loads(line) if isinstance(line, (str, bytes)) else line  # Check if line still needs decoding
+                         for line in islice(filtered_lines, batch_size)]
+                if not batch:
+                    return
 
-            filtered_batch = label_filter.apply_filters([processed_line])
-            for filtered_line in filtered_batch:
-                yield self.process_single_line(json.dumps(filtered_line) if isinstance(filtered_line, dict) else filtered_line, total_bytes)
+                for filtered_line in apply_filters(batch):
+                    # A line can produce several items (conversations); each is streamed as it is built
+                    for transformed_item in process_single_line(filtered_line):
+                        # The output is only serialized to measure it when a byte limit is set
+                        if check_bytes:
+                            line_bytes = dumped_size(transformed_item)
+                            if self.should_stop_processing(total_bytes, line_bytes):
+                                return
+                            total_bytes += line_bytes
 
+                        yield transformed_item
 
-    def process_single_line(self, line: str, total_bytes: int) -> Dict[str, Any]:
+    def process_single_line(self, line: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
-        Processes a single line of the file.
+        Processes a single decoded line of the file and yields the resulting items.
         """
-        transformed_item = self.transform_data(line)
-        json_line = json.dumps(transformed_item, ensure_ascii=False)
-        line_bytes = len(json_line.encode('utf-8'))
-
-        if self.should_stop_processing(total_bytes, line_bytes):
-            return None
-
-        total_bytes += line_bytes
-        return transformed_item
+        return self.transform_data(line)
 
     def random_selector(self, *args, **kwargs) -> Any:
         """
@@ -136,11 +168,9 @@ class BaseFileHandler(ABC):
             return self.random_selector_strategy.select(*args, **kwargs)
 
     def handle_data(self, data):
-        fields_to_include = [condition.field for condition in self.filters]
         # logging.debug(f"data before handle_data: {data}")
         # Process data that meets the criteria
-        self.choose_data_processor()
-        return self.data_processor.process(data,input=self.input, output=self.output, instruction=self.instruction, fields_to_include=fields_to_include)
+        return self.row_handler(data)
 
     def choose_data_processor(self):
         """Chooses the appropriate data processor based on the data type and configuration."""
@@ -151,3 +181,12 @@ class BaseFileHandler(ABC):
         else:
             self.data_processor = AutoDetectDataProcessor()
 
+        # The keyword arguments never change for a file, so they are bound to the processor once
+        self.row_handler = partial(
+            self.data_processor.process,
+            input=self.input,
+            output=self.output,
+            instruction=self.instruction,
+            fields_to_include=self.fields_to_include
+        )
+
@@ -1,3 +1,4 @@
+import os
 import time
 import logging
 from pathlib import Path
@@ -10,6 +11,27 @@ from convector.core.profile import Profile
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 5  # in seconds
 
+def scan_directory(directory_path: Path):
+    """
+    Walks a directory recursively and returns (path, is_file) pairs for all its entries.
+    The directory entries carry their file type, so no extra stat is made per entry.
+    """
+    entries = []
+    pending = [directory_path]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                for entry in scanner:
+                    entries.append((Path(entry.path), entry.is_file()))
+                    # Like rglob, symlinked directories are not followed
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except PermissionError as e:
+            # Like rglob, an unreadable directory is skipped instead of stopping the scan
+            logging.warning(f"Skipping directory {directory}: {e}")
+    return entries
+
 class DirectoryProcessor:
     def __init__(self, directory_path: str, profile: Profile, **kwargs):
         self.directory_path = Path(directory_path)
@@ -30,20 +52,22 @@ class DirectoryProcessor:
         """
         files = self._get_all_files()
         with tqdm(total=len(files), unit='file') as progress_bar:
-            for file_path in files:
-                self._process_or_skip_file(file_path, progress_bar)
+            for file_path, is_file in files:
+                self._process_or_skip_file(file_path, progress_bar, is_file)
 
     def _get_all_files(self):
         """
-        Retrieve all files in the directory.
+        Retrieve all files in the directory, along with whether each entry is a file.
         """
-        return list(self.directory_path.rglob('*'))
+        return scan_directory(self.directory_path)
 
-    def _process_or_skip_file(self, file_path, progress_bar):
+    def _process_or_skip_file(self, file_path, progress_bar, is_file=None):
         """
         Decide whether to process a file or skip it.
         """
-        if file_path.is_file(): 
+        if is_file is None:
+            is_file = file_path.is_file()
+        if is_file: 
             self._process_file(file_path, progress_bar)
         else:
             self._update_progress_bar_for_skipped_file(file_path, progress_bar)
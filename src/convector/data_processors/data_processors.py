@@ -2,34 +2,34 @@
 
 import uuid
 import logging
-from typing import List, Dict, Any
+from itertools import zip_longest
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
 class IDataProcessor:
-    def process(self, data: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
+    def process(self, data: Dict[str, Any], **kwargs) -> Iterator[Dict[str, Any]]:
         raise NotImplementedError("This method should be implemented by subclass")
 
 class ConversationDataProcessor(IDataProcessor):
-    def process(self, data: Any, **kwargs) -> List[Dict[str, Any]]:
+    def process(self, data: Any, **kwargs) -> Iterator[Dict[str, Any]]:
         fields_to_include = kwargs.get('fields_to_include', [])
-        transformed_data = []
 
         # Check if data is a list and process each item in the list
         if isinstance(data, list):
             for item in data:
-                transformed_data.extend(self.process_single_item(item, fields_to_include))
+                yield from self.process_single_item(item, fields_to_include)
         elif isinstance(data, dict):
             # Process a single item
-            transformed_data.extend(self.process_single_item(data, fields_to_include))
+            yield from self.process_single_item(data, fields_to_include)
         else:
             logging.error(f"Unexpected data type: {type(data)}")
-            return []
 
-        return transformed_data
-
-    def process_single_item(self, item: Dict[str, Any], fields_to_include: List[str]) -> List[Dict[str, Any]]:
-        transformed_data = []
-        conversation_id = item.get('conversation_id', uuid.uuid4().hex[:5])
+    def process_single_item(self, item: Dict[str, Any], fields_to_include: List[str]) -> Iterator[Dict[str, Any]]:
+        # Only generate an id when the item does not carry one
+        conversation_id = item['conversation_id'] if 'conversation_id' in item else uuid.uuid4().hex[:5]
         system_prompt = item.get('system_prompt', '') 
+        # Specified fields present in the item are copied to every piece
+        included_fields = {field: item[field] for field in fields_to_include if field in item}
+        transformed = False
 
         if 'conversations' in item:
             # Initialize variables to store the human input and GPT output
@@ -48,81 +48,84 @@ class ConversationDataProcessor(IDataProcessor):
                         "input": human_input,
                         "output": gpt_output
                     }
-                    transformed_data.append(conversation_piece)
+                    conversation_piece.update(included_fields)
+                    transformed = True
+                    yield conversation_piece
 
                     # Reset human_input and gpt_output for the next pair
                     human_input, gpt_output = "", ""
 
         elif 'data' in item:
-            # Process the existing structure
-            conversation_data = item['data']
-            for i in range(0, len(conversation_data), 2):
-                transformed_data.extend(self.extract_conversation_piece(conversation_data, i, conversation_id))
+            # Process the existing structure, pairing each user turn with the following reply
+            for conversation_piece in self.extract_conversation_pieces(item['data'], conversation_id):
+                conversation_piece.update(included_fields)
+                transformed = True
+                yield conversation_piece
         else:
             # Process a single conversation piece
             item['conversation_id'] = conversation_id
-            transformed_data.append(item)
+            transformed = True
+            yield item
 
-        if not transformed_data:
+        if not transformed:
             logging.warning(f"No data transformed in ConversationDataProcessor for: {item}")
-            return []
-
-        # Include specified fields if present
-        for data_item in transformed_data:
-            for field in fields_to_include:
-                if field in item:
-                    data_item[field] = item[field]
 
-        return transformed_data
-
-    def extract_conversation_piece(self, conversation_data, index, conversation_id):
-        try:
-            # Initialize user input and assistant output
-            user_input, assistant_output = "", ""
-
-            # Ensure that we are accessing valid indices
-            if index < len(conversation_data):
-                user_input = conversation_data[index]
-                # Check if the next element exists and is for the assistant's response
-                if index + 1 < len(conversation_data):
-                    assistant_output = conversation_data[index + 1]
-
-            conversation_piece = {
+    def extract_conversation_pieces(self, conversation_data, conversation_id) -> Iterator[Dict[str, Any]]:
+        """
+        Pairs consecutive (user, assistant) turns; a trailing user turn gets an empty output.
+        """
+        turns = iter(conversation_data)
+        for user_input, assistant_output in zip_longest(turns, turns, fillvalue=""):
+            yield {
                 "conversation_id": conversation_id,
                 "instruction": "",
                 "input": user_input,
                 "output": assistant_output
             }
 
-            return [conversation_piece]
-
-        except Exception as e:
-            logging.error(f"Error processing conversation data: {e}")
-            return []
-
 class CustomKeysDataProcessor(IDataProcessor):
-    def process(self, data: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
-        fields_to_include = kwargs.get('fields_to_include', [])
+    def __init__(self):
+        self._row_emitter = None
+
+    def process(self, data: Dict[str, Any], **kwargs) -> Iterator[Dict[str, Any]]:
+        # The keys are the same for every row of a file, so the row builder is set up once
+        if self._row_emitter is None:
+            self._row_emitter = self.build_row_emitter(**kwargs)
+        return self._row_emitter(data)
+
+    def build_row_emitter(self, **kwargs) -> Callable[[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Builds the function transforming a row, with the configured keys bound as locals.
+        """
+        fields_to_include = tuple(kwargs.get('fields_to_include') or ())
         input_key = kwargs.get('input')
         output_key = kwargs.get('output')
         instruction_key = kwargs.get('instruction')
-        
-        if not (input_key and output_key) or input_key not in data or output_key not in data:
+
+        if not (input_key and output_key):
             logging.error("The necessary keys are missing or do not match the data structure.")
             raise ValueError("The necessary keys are missing or do not match the data structure.")
-        
-        transformed_data = {
-            "instruction": data.get(instruction_key, ""),
-            "input": data.get(input_key, ""),
-            "output": data.get(output_key, "")
-        }
 
-        # Include specified fields if present
-        for field in fields_to_include:
-            if field in data:
-                transformed_data[field] = data[field]
+        def emit(data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+            # A missing key is the only sign that the configured keys do not match the data
+            if input_key not in data or output_key not in data:
+                logging.error("The necessary keys are missing or do not match the data structure.")
+                raise ValueError("The necessary keys are missing or do not match the data structure.")
+
+            transformed_data = {
+                "instruction": data.get(instruction_key, ""),
+                "input": data.get(input_key, ""),
+                "output": data.get(output_key, "")
+            }
+
+            # Include specified fields if present
+            for field in fields_to_include:
+                if field in data:
+                    transformed_data[field] = data[field]
 
-        return [transformed_data]
+            yield transformed_data
+
+        return emit
 
 class AutoDetectDataProcessor(IDataProcessor):
     def __init__(self):
@@ -132,19 +135,25 @@ class AutoDetectDataProcessor(IDataProcessor):
             "output": ["answer", "output", "bot_reply", "response"]
         }
         self.detected_schema = {}
+        self.detected_variant = None
 
-    def process(self, data: Dict[str, Any], **kwargs) -> List[Dict[str, Any]]:
+    def process(self, data: Dict[str, Any], **kwargs) -> Iterator[Dict[str, Any]]:
         fields_to_include = kwargs.get('fields_to_include', [])
-        self.detect_schema(data)
 
-        if not all(key in self.detected_schema for key in ['instruction', 'input', 'output']):
-            logging.error("Required keys not detected in data.")
-            return []
+        # Rows of a file almost always share one layout, so the keys detected on
+        # the first row are reused until a row no longer carries them.
+        variant = self.detected_variant
+        if variant is None or not (variant[0] in data and variant[1] in data and variant[2] in data):
+            variant = self.detect_variant(data)
+            if variant is None:
+                logging.error("Required keys not detected in data.")
+                return
 
+        instruction_key, input_key, output_key = variant
         transformed_data = {
-            "instruction": data.get(self.detected_schema.get("instruction", ""), ""),
-            "input": data.get(self.detected_schema.get("input", ""), ""),
-            "output": data.get(self.detected_schema.get("output", ""), "")
+            "instruction": data[instruction_key],
+            "input": data[input_key],
+            "output": data[output_key]
         }
 
         # Include specified fields if present
@@ -152,7 +161,7 @@ class AutoDetectDataProcessor(IDataProcessor):
             if field in data:
                 transformed_data[field] = data[field]
 
-        return [transformed_data]
+        yield transformed_data
 
     def detect_schema(self, data: Dict[str, Any]):
         # Reset detected schema
@@ -171,3 +180,19 @@ class AutoDetectDataProcessor(IDataProcessor):
                 if field_name in data:
                     self.detected_schema[schema_key] = field_name
                     break
+
+    def detect_variant(self, data: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        """
+        Detects the schema of the row and caches the (instruction, input, output) keys.
+        Returns None when one of the required keys is missing.
+        """
+        self.detect_schema(data)
+        if not all(key in self.detected_schema for key in ['instruction', 'input', 'output']):
+            self.detected_variant = None
+        else:
+            self.detected_variant = (
+                self.detected_schema["instruction"],
+                self.detected_schema["input"],
+                self.detected_schema["output"]
+            )
+        return self.detected_variant
@@ -1,8 +1,8 @@
 # csv_file_handler.py
 
-import csv
 import logging
-from typing import Generator, Dict, Any
+import pandas as pd
+from typing import Generator, Dict, Any, Iterator
 from convector.core.base_file_handler import BaseFileHandler
 
 class CSVFileHandler(BaseFileHandler):
@@ -12,20 +12,29 @@ class CSVFileHandler(BaseFileHandler):
     provided by ConvectorConfig.
     """
 
+    chunk_size = 8192
+
     def read_file(self) -> Generator:
         """
         Generator that reads a CSV file row by row.
+        The file is parsed in chunks by pandas and each chunk is converted to dicts at once.
         """
+        # Without random selection only the first `lines` rows are ever used.
+        nrows = None if self.random_selection else self.lines
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    yield row
+            # Every cell is kept as a string, like csv.DictReader does.
+            with pd.read_csv(self.file_path, encoding='utf-8', dtype=str, keep_default_na=False,
+                             chunksize=self.chunk_size, nrows=nrows) as reader:
+                for chunk in reader:
+                    yield from chunk.to_dict('records')
+        except pd.errors.EmptyDataError:
+            # An empty file has no header and no rows, like csv.DictReader it yields nothing.
+            return
         except Exception as e:
             logging.error(f"Failed to read the CSV file at {self.file_path}: {e}")
             raise
 
-    def transform_data(self, original_data: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_data(self, original_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
         Transforms a row of CSV file into the desired format and then processes it using handle_data.
         """
@@ -1,7 +1,8 @@
 import json
 import logging
-from typing import Generator, Dict, Any
-from convector.core.base_file_handler import BaseFileHandler
+from typing import Generator, Dict, Any, Iterator
+from convector.core.base_file_handler import BaseFileHandler, paused_gc
+from convector.utils.json_utils import loads
 
 class JSONFileHandler(BaseFileHandler):
     """
@@ -15,11 +16,11 @@ class JSONFileHandler(BaseFileHandler):
         Generator that reads a JSON file and yields its content.
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
+            with open(self.file_path, 'rb') as file:
                 file_content = file.read()
 
-                # Parsing the JSON content
-                data = json.loads(file_content)
+                # Parsing the JSON content straight from bytes
+                data = loads(file_content)
 
                 # Handling both list and dictionary types of JSON
                 if isinstance(data, list):
@@ -39,7 +40,7 @@ class JSONFileHandler(BaseFileHandler):
             logging.error(f"Failed to read the JSON file at {self.file_path}: {e}")
             raise
 
-    def transform_data(self, original_data: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_data(self, original_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
         Transforms JSON data into the desired format and then processes it using handle_data.
         """
@@ -54,9 +55,10 @@ class JSONFileHandler(BaseFileHandler):
         transformed data objects.
         """
         try:
-            for transformed_item in self.read_file():
-                if transformed_item is not None:
-                    yield self.transform_data(transformed_item)
+            with paused_gc():
+                for transformed_item in self.read_file():
+                    if transformed_item is not None:
+                        yield from self.transform_data(transformed_item)
         except Exception as e:
             logging.error(f"An error occurred while handling the JSON file: {e}")
             raise
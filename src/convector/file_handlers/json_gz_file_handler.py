@@ -3,8 +3,9 @@
 import json
 import logging
 import gzip
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Iterator
 from convector.core.base_file_handler import BaseFileHandler
+from convector.utils.json_utils import iter_json_lines
 
 class JSONGZFileHandler(BaseFileHandler):
     """
@@ -13,25 +14,24 @@ class JSONGZFileHandler(BaseFileHandler):
     configuration provided by ConvectorConfig.
     """
 
-    def read_file(self) -> Generator[str, None, None]:
+    def read_file(self) -> Generator[bytes, None, None]:
         """
-        Generator that reads a gzipped JSON file line by line.
+        Generator that reads a gzipped JSON file line by line, as undecoded bytes.
         """
         try:
-            with gzip.open(self.file_path, 'rt', encoding='utf-8') as file:
-                for line in file:
-                    yield line
+            with gzip.open(self.file_path, 'rb') as file:
+                yield from iter_json_lines(file.read)
         except Exception as e:
             logging.error(f"Failed to read the gzipped JSON file at {self.file_path}: {e}")
             raise
 
-    def transform_data(self, original_data: str) -> Dict[str, Any]:
+    def transform_data(self, original_data: str) -> Iterator[Dict[str, Any]]:
         """
         Transforms a line of gzipped JSON file into the desired format and then processes it 
         using handle_data.
         """
-        # Decode JSON line
-        decoded_data = json.loads(original_data)
+        # Decode JSON line if necessary
+        decoded_data = json.loads(original_data) if isinstance(original_data, str) else original_data
         # Process data using handle_data from BaseFileHandler
         processed_data = super().handle_data(decoded_data)
         # Apply filters and schema here if needed before returning
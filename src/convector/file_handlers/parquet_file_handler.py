@@ -17,8 +17,11 @@ class ParquetFileHandler(BaseFileHandler):
             logging.error(f"Failed to read the Parquet file at {self.file_path}: {e}")
             raise
         else:
-            for _, row in df.iterrows():
-                yield row.to_dict()
+            # Walk the columns side by side instead of building a Series per row;
+            # tolist() also converts the values to native Python types once per column.
+            columns = list(df.columns)
+            for values in zip(*(df[column].tolist() for column in columns)):
+                yield dict(zip(columns, values))
 
     def transform_data(self, original_data):
         """
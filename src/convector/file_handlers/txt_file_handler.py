@@ -11,12 +11,13 @@ class TXTFileHandler(BaseFileHandler):
     provided by ConvectorConfig.
     """
 
-    def read_file(self) -> Generator[str, None, None]:
+    def read_file(self) -> Generator[bytes, None, None]:
         """
-        Generator that reads a TXT file line by line.
+        Generator that reads a TXT file line by line, as bytes: the lines are parsed from
+        their UTF-8 bytes, so they are never decoded to str first.
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
+            with open(self.file_path, 'rb') as file:
                 for line in file:
                     yield line.strip()  # Stripping to remove any leading/trailing whitespace
         except Exception as e:
@@ -1,9 +1,9 @@
 import zstandard as zstd
 import json
 import logging
-import io
 from typing import Generator, Dict, Any
 from convector.core.base_file_handler import BaseFileHandler
+from convector.utils.json_utils import iter_json_lines
 
 class ZSTFileHandler(BaseFileHandler):
     """
@@ -13,14 +13,12 @@ class ZSTFileHandler(BaseFileHandler):
     """
 
     def read_file(self):
-        """Generator that reads a ZST file line by line."""
+        """Generator that reads a ZST file line by line, as undecoded bytes."""
         try:
             with open(self.file_path, 'rb') as fh:
                 dctx = zstd.ZstdDecompressor()
                 with dctx.stream_reader(fh) as reader:
-                    text_stream = io.TextIOWrapper(reader, encoding='utf-8')
-                    for line in text_stream:
-                        yield line
+                    yield from iter_json_lines(reader.read)
         except Exception as e:
             logging.error(f"Failed to read the ZST file at {self.file_path}: {e}")
             raise
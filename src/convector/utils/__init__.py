@@ -1,3 +1,4 @@
 from .output_schema_handler import OutputSchemaHandler
+from .label_filter import LabelFilter, Condition
 from .random_selector import ByteRandomSelector, LineRandomSelector, ConversationRandomSelector
 from .config_utils import setup_logging
\ No newline at end of file
@@ -0,0 +1,50 @@
+# config_utils.py
+
+import copy
+import logging
+import logging.config
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+from convector.core.convector_config import ConvectorConfig
+
+try:
+    # libyaml's C loader parses several times faster than the pure-Python one.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+PERSISTENT_CONFIG_PATH = Path.home() / '.convector_config'
+
+@lru_cache(maxsize=4)
+def load_yaml_config(path: str, mtime: float, size: int) -> Dict[str, Any]:
+    """
+    Parses a YAML file. The modification time and size are part of the cache key,
+    so an unchanged file is only parsed once per process.
+    """
+    with open(path, 'rt') as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+def setup_logging(default_path: str = None, default_level=logging.INFO):
+    """Setup logging configuration from a YAML file."""
+    if default_path is None:
+        if PERSISTENT_CONFIG_PATH.exists():
+            with open(PERSISTENT_CONFIG_PATH, 'r') as file:
+                convector_root_dir = file.read().strip()
+                default_path = Path(convector_root_dir) / 'config.yaml'
+        else:
+            config = ConvectorConfig()
+            default_path = Path(config.convector_root_dir) / 'config.yaml'
+
+    try:
+        stat = os.stat(default_path)
+        config = load_yaml_config(str(default_path), stat.st_mtime, stat.st_size)
+        # dictConfig consumes the dictionary it is given, so the cached one is copied
+        logging.config.dictConfig(copy.deepcopy(config))
+    except FileNotFoundError:
+        logging.warning(f"Logging configuration file is not found at '{default_path}'. Using default configs.")
+        logging.basicConfig(level=default_level)
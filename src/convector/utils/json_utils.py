@@ -0,0 +1,157 @@
+# json_utils.py
+
+import json
+import mmap
+import queue
+import threading
+from contextlib import closing, nullcontext
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Union
+
+try:
+    # orjson parses and serializes in C and works on bytes directly.
+    import orjson
+
+    # Digits map to b'0' and every other byte to a space: a run of 19 digits, which may be an
+    # integer past 64 bits that orjson would parse into a float, is then found by a substring search
+    DIGITS_TABLE = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+    LONG_DIGIT_RUN = b'0' * 19
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """
+        Parses a JSON document with orjson. The documents orjson rejects (NaN, Infinity) or
+        could alter (integers past 64 bits) are parsed by the json module, as they were before.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if LONG_DIGIT_RUN not in data.translate(DIGITS_TABLE):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serializes an object to UTF-8 encoded JSON bytes with orjson, or with the json module
+        for the integers past 64 bits orjson cannot write.
+        """
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def dumped_size(obj: Any) -> int:
+        """
+        Returns the size in bytes of the JSON serialization of an object.
+        """
+        return len(dumps(obj))
+except ImportError:
+    try:
+        # ujson is a C parser too, for deployments where orjson cannot be installed.
+        import ujson
+        from ujson import loads
+
+        # Forward slashes are left unescaped, like orjson and json do
+        dumps_str = partial(ujson.dumps, ensure_ascii=False, escape_forward_slashes=False)
+    except ImportError:
+        from json import loads
+
+        # Without spaces after the separators, the output has the same bytes as orjson's
+        dumps_str = partial(json.dumps, ensure_ascii=False, separators=(',', ':'))
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serializes an object to UTF-8 encoded JSON bytes.
+        """
+        return dumps_str(obj).encode('utf-8')
+
+    def dumped_size(obj: Any) -> int:
+        """
+        Returns the size in bytes of the JSON serialization of an object.
+        """
+        json_line = dumps_str(obj)
+        # An ASCII string has as many bytes as characters, so only other strings are encoded
+        return len(json_line) if json_line.isascii() else len(json_line.encode('utf-8'))
+
+
+def iter_prefetched(read: Callable[[int], bytes], chunk_size: int = 1 << 20, depth: int = 4) -> Iterator[bytes]:
+    """
+    Yields the chunks of a byte stream, read ahead by a background thread: reading and
+    decompressing (which release the GIL) overlap with the processing of the previous chunks.
+    At most `depth` chunks are held in advance.
+    """
+    chunks = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any):
+        # Gives up once the consumer has stopped, instead of blocking on a full queue
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def produce():
+        try:
+            while not stop.is_set():
+                chunk = read(chunk_size)
+                put(chunk)
+                if not chunk:
+                    return
+        except BaseException as error:
+            put(error)
+
+    reader = threading.Thread(target=produce, daemon=True)
+    reader.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        # The stream is usually closed by the caller right after, so the reader must be done with it
+        stop.set()
+        reader.join()
+
+def iter_json_lines(read: Callable[[int], bytes], chunk_size: int = 1 << 20, prefetch: bool = False) -> Iterator[bytes]:
+    """
+    Yields the non-empty lines of a byte stream without decoding them.
+    `read` is called with `chunk_size` and must return b'' once the stream is exhausted.
+    The stream is read in the calling thread unless `prefetch` is set, in which case it is
+    read ahead in a background thread (see iter_prefetched).
+    """
+    chunks = iter_prefetched(read, chunk_size) if prefetch else iter(partial(read, chunk_size), b'')
+    buffer = b''
+    with closing(chunks) if prefetch else nullcontext():
+        for chunk in chunks:
+            buffer += chunk
+            end = buffer.rfind(b'\n')
+            if end == -1:
+                continue
+            for line in buffer[:end].split(b'\n'):
+                if line and not line.isspace():
+                    yield line
+            buffer = buffer[end + 1:]
+
+    if buffer and not buffer.isspace():
+        yield buffer
+
+def iter_mapped_lines(mapped: mmap.mmap, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yields the non-empty lines found between `start` and `end` of a memory-mapped file.
+    """
+    end = len(mapped) if end is None else end
+    position = start
+    while position < end:
+        newline = mapped.find(b'\n', position, end)
+        if newline == -1:
+            newline = end
+        line = mapped[position:newline]
+        if line and not line.isspace():
+            yield line
+        position = newline + 1
@@ -1,19 +1,113 @@
 import re
-from typing import List, Dict, Any
+import sys
+from functools import lru_cache, partial
+from operator import eq, ne, lt, gt
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 import logging
 from convector.core.profile import FilterCondition
 
+# Compiled once at import instead of on every parse
+CONDITION_PATTERN = re.compile(r"([\w\.]+)(!=|==|=|<|>)?(.*)")
+BETWEEN_OPERATOR = "<=>"
+
+def split_condition(spec: str) -> Optional[Tuple[str, Optional[str], str]]:
+    """
+    Splits a condition specification string into its field, operator and value.
+    Returns None when the string is not a valid specification.
+    """
+    # The range operator is split off first, the pattern would read "<=>" as "<"
+    field, operator, value = spec.partition(BETWEEN_OPERATOR)
+    if operator:
+        return field, operator, value
+
+    match = CONDITION_PATTERN.match(spec)
+    return match.groups() if match else None
+
+def make_between(lower: Any, upper: Any) -> Callable[[Any, Any], bool]:
+    """
+    Builds the comparison checking that an item's value lies within the given bounds.
+    """
+    def compare_between(item_value: Any, condition_value: Any) -> bool:
+        return lower <= item_value <= upper
+
+    return compare_between
+
+# Comparison function for each operator, looked up once per condition
+OPERATORS = {
+    None: lambda item_value, condition_value: True,
+    "=": eq,
+    "==": eq,
+    "!=": ne,
+    "<": lt,
+    ">": gt,
+}
+
+def make_getter(fields: Tuple[str, ...]) -> Callable[[Dict], Any]:
+    """
+    Builds an accessor returning the value found at the nested `fields` of an item,
+    or None when one of them is missing.
+    """
+    if len(fields) == 1:
+        return lambda item, key=fields[0]: item.get(key)
+    return partial(get_nested, fields=fields)
+
+def get_nested(item: Dict, fields: Iterable[str]) -> Any:
+    """
+    Fetches the value at the nested `fields` of an item, or None when one of them is missing
+    or a level is not a dictionary. Indexing directly keeps the found path free of checks.
+    """
+    try:
+        for field in fields:
+            item = item[field]
+    except (KeyError, TypeError):
+        return None
+    return item
+
+def field_missing(field: List[str]) -> bool:
+    """
+    Reports a filtered field missing from an item, which then does not match.
+    """
+    logging.error(f"Field not found in item: {field}")
+    return False
 
 class Condition:
     """
     This class represents a single condition in the filter.
     It holds the field to be filtered, the operator, and the value to compare against.
     """
+    __slots__ = ('field', '_fields', '_getter', 'operator', 'value', 'is_inclusion',
+                 '_needs_cast', '_lo', '_hi', '_cmp', '_value_type', '_key')
+
     def __init__(self, field: str, operator: str = None, value: Any = None):
         self.field = field.split('.')
+        # The path never changes, so its accessor is built once; the keys are interned
+        # so dict lookups mostly succeed on the identity check
+        self._fields = tuple(sys.intern(key) for key in self.field)
+        self._getter = make_getter(self._fields)
         self.operator = operator
         self.value = self.cast_value(value)
         self.is_inclusion = operator is None and value is None
+        # A string value failed to cast to a number, so an item value can only be equal to it
+        # if its string form is: the string is compared as is, without trying to cast it
+        self._needs_cast = not (operator in ("=", "==", "!=") and isinstance(self.value, str))
+        if operator == BETWEEN_OPERATOR:
+            # The "lower,upper" bounds are split and cast here rather than for every item
+            try:
+                self._lo, self._hi = map(self.cast_value, value.split(','))
+            except (AttributeError, ValueError):
+                raise ValueError(f"Invalid range '{value}' for field '{field}', expected 'lower,upper'")
+            self._cmp = make_between(self._lo, self._hi)
+            # Item values already of the bounds' type are compared as they are
+            self._value_type = type(self._lo) if type(self._lo) is type(self._hi) else None
+            self._key = (self._fields, operator, self.value)
+        else:
+            self._lo = self._hi = None
+            # Unknown operators never match
+            self._cmp = OPERATORS.get(operator, lambda item_value, condition_value: False)
+            # Item values already of the value's type are compared as they are
+            self._value_type = type(self.value)
+            # Operators sharing a comparison (= and ==) make the same condition
+            self._key = (self._fields, self._cmp, self.value)
 
     @staticmethod
     def cast_value(value: str) -> Any:
@@ -37,67 +131,50 @@ class Condition:
         """
         Recursively fetches the value from nested dictionaries based on the given fields.
         """
-        for field in fields:
-            item = item.get(field, {})
-        return item if item != {} else None
+        return get_nested(item, fields)
 
     def matches(self, item: Dict) -> bool:
         if self.is_inclusion:
             # For field inclusion, always return True
             return True
 
-        item_value = self.get_nested_value(item, self.field)
+        item_value = self._getter(item)
         if item_value is None:
             logging.error(f"Field not found in item: {self.field}")
             return False
 
-        item_value = self.cast_value(str(item_value))
-        return self.compare_values(item_value, self.value)
+        if type(item_value) is not self._value_type:
+            item_value = str(item_value)
+            if self._needs_cast:
+                item_value = self.cast_value(item_value)
+        return self._cmp(item_value, self.value)
 
     def field_exists_in_item(self, item: Dict, fields: List[str]) -> bool:
         """
         Checks if the specified fields exist in the item.
         """
-        for field in fields:
-            if field not in item:
-                return False
-            item = item[field]
+        try:
+            for field in fields:
+                item = item[field]
+        except (KeyError, TypeError):
+            return False
         return True
 
     def compare_values(self, item_value: Any, condition_value: Any) -> bool:
         """
         Compares the item's value against the condition's value based on the operator.
         """
-        if self.operator is None:
-            return True
-        elif self.operator in ["=", "=="]:
-            return item_value == condition_value
-        elif self.operator == "!=":
-            return item_value != condition_value
-        elif self.operator == "<":
-            return item_value < condition_value
-        elif self.operator == ">":
-            return item_value > condition_value
-        elif self.operator == "<=>":
-            lower, upper = map(self.cast_value, condition_value.split(','))
-            return lower <= item_value <= upper
-        return False
+        return self._cmp(item_value, condition_value)
 
     @staticmethod
     def parse(spec: str) -> 'Condition':
         """
         Parses a condition specification string into a Condition object.
         """
-        if "<=>" in spec:
-            field, value = spec.split("<=>")
-            return Condition(field, "<=>", value)
-
-        match = re.match(r"([\w\.]+)(!=|==|=|<|>)?(.*)", spec)
-        if not match:
+        parts = split_condition(spec)
+        if parts is None:
             raise ValueError(f"Invalid specification string: {spec}")
-
-        field, operator, value = match.groups()
-        return Condition(field, operator, value)
+        return Condition(*parts)
     
     @staticmethod
     def convert_to_condition(filter_condition: FilterCondition) -> 'Condition':
@@ -107,33 +184,103 @@ class Condition:
         return Condition(field, operator, value)
 
 class LabelFilter:
+    __slots__ = ('conditions', '_filter_conds', '_incl_conds', '_inclusion_fields', '_match', '_filter_batch')
+
     def __init__(self, filter_conditions: List[Condition]):
-        self.conditions = [Condition.convert_to_condition(fc) for fc in filter_conditions]
+        spec = tuple((fc.field, fc.operator, fc.value) for fc in filter_conditions)
+        conditions, self._filter_conds, self._incl_conds, self._inclusion_fields, self._match, self._filter_batch = self.build(spec)
+        self.conditions = list(conditions)
 
-    def apply_filters(self, data_batch: List[Dict]) -> List[Dict]:
-        all_inclusions = all(condition.is_inclusion for condition in self.conditions)
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def build(spec: Tuple[Tuple[str, Optional[str], Optional[str]], ...]) -> Tuple:
+        """
+        Parses the conditions and generates the filter functions once per (field, operator, value)
+        specification; conditions never change once built, so filters with the same specification share them.
+        """
+        conditions = tuple(Condition(field, operator or None, value or None) for field, operator, value in spec)
+        # Split once so filtering and field inclusion do not rescan the conditions per item
+        filter_conds = LabelFilter.unique_conditions(cond for cond in conditions if not cond.is_inclusion)
+        incl_conds = [cond for cond in conditions if cond.is_inclusion]
+        inclusion_fields = tuple(field for cond in incl_conds for field in cond._fields)
+        match, filter_batch = LabelFilter.compile(filter_conds, inclusion_fields)
+        return conditions, filter_conds, incl_conds, inclusion_fields, match, filter_batch
 
-        if all_inclusions:
-            included_data = [self.include_fields(item) for item in data_batch]
-            return included_data
+    @staticmethod
+    def unique_conditions(conditions: Iterable[Condition]) -> List[Condition]:
+        """
+        Drops repeated conditions (same field, comparison and value), keeping the first one.
+        """
+        seen = set()
+        unique = []
+        for condition in conditions:
+            if condition._key not in seen:
+                seen.add(condition._key)
+                unique.append(condition)
+        return unique
+
+    @staticmethod
+    def compile(filter_conds: List[Condition], inclusion_fields: Tuple[str, ...]) -> Tuple[Callable[[Dict], bool], Callable[[List[Dict]], List[Dict]]]:
+        """
+        Generates a function testing every filter condition on an item, and one filtering a
+        whole batch with the same tests inlined in its loop. The field paths, comparisons and
+        values are inlined, so nothing is dispatched per condition or per item at run time.
+        """
+        namespace = {"cast_value": Condition.cast_value, "inclusion_fields": inclusion_fields}
+        for index, condition in enumerate(filter_conds):
+            namespace[f"compare_{index}"] = condition._cmp
+            namespace[f"value_{index}"] = condition.value
+            namespace[f"missing_{index}"] = partial(field_missing, condition.field)
+            namespace[f"type_{index}"] = condition._value_type
+
+        def emit_checks(indent: str, reject: Callable[[str], List[str]]) -> List[str]:
+            # `reject` gives the statements dropping the item, from the expression it evaluates to
+            lines = []
+            for index, condition in enumerate(filter_conds):
+                if len(condition._fields) == 1:
+                    lines.append(f"value = item.get({condition._fields[0]!r})")
+                else:
+                    # Nested paths are indexed in one expression, a missing level raising instead
+                    lines.append("try:")
+                    lines.append("    value = item" + "".join(f"[{field!r}]" for field in condition._fields))
+                    lines.append("except (KeyError, TypeError):")
+                    lines.extend("    " + line for line in reject(f"missing_{index}()"))
+                lines.append("if value is None:")
+                lines.extend("    " + line for line in reject(f"missing_{index}()"))
+                lines.append(f"if type(value) is not type_{index}:")
+                lines.append("    value = cast_value(str(value))" if condition._needs_cast else "    value = str(value)")
+                lines.append(f"if not compare_{index}(value, value_{index}):")
+                lines.extend("    " + line for line in reject("False"))
+            return [indent + line for line in lines]
+
+        source = ["def match(item):"]
+        source.extend(emit_checks("    ", lambda result: [f"return {result}"]))
+        source.append("    return True")
 
-        filtered_data = []
-        for item in data_batch:
-            matches = self.matches_all_conditions(item)
-            if matches:
-                item = self.include_fields(item)
-                filtered_data.append(item)
-        return filtered_data
+        # The batch loop runs in the generated code, without a call per item
+        source.append("def filter_batch(data_batch):")
+        source.append("    filtered_data = []")
+        source.append("    append = filtered_data.append")
+        source.append("    for item in data_batch:")
+        source.extend(emit_checks("        ", lambda result: ([] if result == "False" else [result]) + ["continue"]))
+        if inclusion_fields:
+            source.append("        item = {**item, **{field: item.get(field) for field in inclusion_fields}}")
+        source.append("        append(item)")
+        source.append("    return filtered_data")
+
+        exec("\n".join(source), namespace)
+        return namespace["match"], namespace["filter_batch"]
+
+    def apply_filters(self, data_batch: List[Dict]) -> List[Dict]:
+        # Matching and field inclusion are done in the same pass over the batch
+        return self._filter_batch(data_batch)
 
     def include_fields(self, item: Dict) -> Dict:
         """
         Ensures specified fields are included in the item.
         """
-        inclusion_fields = {field: item.get(field) for condition in self.conditions if condition.is_inclusion for field in condition.field}
+        inclusion_fields = {field: item.get(field) for field in self._inclusion_fields}
         return {**item, **inclusion_fields}  # Merge included fields with existing item
 
     def matches_all_conditions(self, item: Dict) -> bool:
-        filter_conditions = [cond for cond in self.conditions if not cond.is_inclusion]
-        if not filter_conditions:
-            return True  # If there are no filter conditions, all items match
-        return all(condition.matches(item) for condition in filter_conditions)
+        return self._match(item)
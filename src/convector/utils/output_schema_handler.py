@@ -1,105 +1,132 @@
-from typing import List, Dict, Optional, Any, Generator
-from inspect import signature
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Any, Generator, Tuple
 
 from convector.core.profile import FilterCondition, Profile
 
+# Keys always present in the output of the default schema
+DEFAULT_KEYS = ("instruction", "input", "output")
+
+# Roles of the chat completion messages
+SYSTEM_ROLE = "system"
+USER_ROLE = "user"
+ASSISTANT_ROLE = "assistant"
+
+@lru_cache(maxsize=None)
+def compile_default_schema(optional_keys: Tuple[str, ...]) -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Generates the default schema function for a set of optional keys, each copied by its own
+    test, so no loop over the keys runs per item. One function is built per set of keys.
+    """
+    source = [
+        "def apply_default_schema(data):",
+        "    transformed_data = []",
+        "    append = transformed_data.append",
+        "    for item in data:",
+        "        get = item.get",
+        '        transformed_item = {"instruction": get("instruction", ""), "input": get("input", ""), "output": get("output", "")}',
+    ]
+    for key in optional_keys:
+        source.append(f"        if {key!r} in item:")
+        source.append(f"            transformed_item[{key!r}] = item[{key!r}]")
+    source.append("        append(transformed_item)")
+    source.append("    return transformed_data")
+
+    namespace = {}
+    exec("\n".join(source), namespace)
+    return namespace["apply_default_schema"]
+
 class OutputSchemaHandler:
     def __init__(self, schema_name: Optional[str] = "default", filters: Optional[List[FilterCondition]] = None):
         self.schema_name = schema_name
         self.filters = filters
-        self.fields_to_include = self.extract_fields_from_filters() if filters else None
-
-    def extract_fields_from_filters(self) -> List[str]:
+        self.fields_to_include = self.extract_fields_from_filters() if filters else ()
+        # Keys copied by the default schema only when an item has them, in output order
+        self._optional_keys = tuple(dict.fromkeys(
+            key for key in ("conversation_id",) + self.fields_to_include if key not in DEFAULT_KEYS
+        ))
+        self._apply_default = compile_default_schema(self._optional_keys)
+        # The chat schema has no input/output keys, filter fields named after them are copied too
+        self._chat_optional_keys = tuple(dict.fromkeys(("conversation_id",) + self.fields_to_include))
+        # The schema never changes, so its method is resolved once and an unknown one is reported early
+        self._handler = self.schema_method(schema_name)
+        if not self._handler:
+            raise ValueError(f"Unsupported schema '{schema_name}'")
+
+    def extract_fields_from_filters(self) -> Tuple[str, ...]:
         """
         Extracts field names from filter conditions to determine which fields to include in the output.
         """
-        fields = [condition.field for condition in self.filters]
-        return fields
+        return tuple(condition.field for condition in self.filters)
     
-    def apply_schema(self, data: Any, **kwargs) -> Any:
+    def apply_schema(self, data: Any, *, validate: bool = True, **kwargs) -> Any:
         """
         Apply the selected schema to the data.
+        With validate=True, the data is checked to be a dictionary or a list starting with one;
+        callers already guaranteeing dictionaries pass validate=False to skip the check.
         """
         is_single_item = isinstance(data, dict)
         if is_single_item:
             data = [data]  
-
-        if not all(isinstance(item, dict) for item in data):
+        elif validate and data and not isinstance(data[0], dict):
             raise TypeError("apply_schema expects a list of dictionaries or a single dictionary.")
 
-        handler_method = getattr(self, f"apply_{self.schema_name}_schema", None)
-        if not handler_method:
-            raise ValueError(f"Unsupported schema '{self.schema_name}'")
-
-        transformed_data = handler_method(data=data, **kwargs)
+        transformed_data = self._handler(self, data=data, **kwargs)
         return transformed_data[0] if is_single_item else transformed_data
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def schema_method(cls, schema_name: str) -> Optional[Callable]:
+        """
+        Resolves the method implementing a schema once per class and schema name.
+        """
+        return getattr(cls, f"apply_{schema_name}_schema", None)
     
     def batch_data(self, data: List[Dict[str, Any]], batch_size: int) -> Generator[List[Dict[str, Any]], None, None]:
         """
         Custom function to batch the data.
         This function assumes that each conversation ends after the assistant's content.
         """
-        batch = []
-        for item in data:
-            if item.get('role') == 'assistant':
-                batch.append(item)
-                if len(batch) >= batch_size:
-                    yield batch
-                    batch = []
-            else:
-                batch.append(item)
-
-        if batch:
-            yield batch
+        if not isinstance(data, list):
+            data = list(data)
+
+        # A batch can only be closed after an assistant message: the candidate ends are found
+        # in one pass and the batches are sliced out of the data
+        assistant_indices = [index for index, item in enumerate(data) if item.get('role') == ASSISTANT_ROLE]
+        start = 0
+        for end in assistant_indices:
+            if end - start + 1 >= batch_size:
+                yield data[start:end + 1]
+                start = end + 1
+
+        if start < len(data):
+            yield data[start:]
     
     def apply_default_schema(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        transformed_data = []
-        for item in data:
-            transformed_item = {
-                "instruction": item.get("instruction", ""),
-                "input": item.get("input", ""),
-                "output": item.get("output", "")
-            }
-
-            # Include conversation_id if present
-            if 'conversation_id' in item:
-                transformed_item['conversation_id'] = item['conversation_id']
-
-            # Add additional fields specified in filters
-            if self.fields_to_include:
-                for field in self.fields_to_include:
-                    if field in item:
-                        transformed_item[field] = item[field]
-
-            transformed_data.append(transformed_item)
-
-        return transformed_data
+        # Generated for this handler's optional keys (conversation_id and the filter fields)
+        return self._apply_default(data)
 
     def apply_chat_completion_schema(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         chat_completions = []
+        append = chat_completions.append
+        optional_keys = self._chat_optional_keys
         for item in data:
-            chat_completion = {
-                "messages": [
-                    {"role": "system", "content": item.get("instruction", "")},  # Always include system message
-                    {"role": "user", "content": item.get("input", "")} if item.get("input") else None,
-                    {"role": "assistant", "content": item.get("output", "")} if item.get("output") else None
-                ]
-            }
-
-            # Include conversation_id if present
-            if 'conversation_id' in item:
-                chat_completion['conversation_id'] = item['conversation_id']
-
-            # Add additional fields specified in filters
-            if self.fields_to_include:
-                for field in self.fields_to_include:
-                    if field in item:
-                        chat_completion[field] = item[field]
-
-            # Remove None entries from messages
-            chat_completion["messages"] = [msg for msg in chat_completion["messages"] if msg is not None]
-
-            chat_completions.append(chat_completion)
+            get = item.get
+            # Input and output are read once and reused for the test and the content
+            user_input = get("input")
+            assistant_output = get("output")
+            messages = [{"role": SYSTEM_ROLE, "content": get("instruction", "")}]  # Always include system message
+            # User and assistant messages are only added when they have content
+            if user_input:
+                messages.append({"role": USER_ROLE, "content": user_input})
+            if assistant_output:
+                messages.append({"role": ASSISTANT_ROLE, "content": assistant_output})
+            chat_completion = {"messages": messages}
+
+            # Include conversation_id and the fields specified in filters if present
+            for key in optional_keys:
+                if key in item:
+                    chat_completion[key] = item[key]
+
+            append(chat_completion)
 
         return chat_completions
-
@@ -1,63 +1,107 @@
 # random_selectors.py
 
-from typing import Any, TextIO
-import json
+from typing import Any, BinaryIO, Iterator
 import random
+from operator import itemgetter
+
+from convector.utils.json_utils import loads, dumped_size
 
 class IRandomSelector:
-    def select(self, file: TextIO, *args, **kwargs) -> Any:
+    def select(self, file: BinaryIO, *args, **kwargs) -> Any:
         raise NotImplementedError("This method should be implemented by subclass")
 
+def is_system_line(line: Any) -> bool:
+    """
+    Tells whether a line opens a conversation, i.e. holds a message with the system role.
+    """
+    if not isinstance(line, (str, bytes)):
+        return line.get('role') == 'system'
+    # Lines not even mentioning the system role are ruled out without being parsed
+    marker = b'"system"' if isinstance(line, bytes) else '"system"'
+    return marker in line and loads(line).get('role') == 'system'
+
+def decode_line(line: Any) -> Any:
+    return loads(line) if isinstance(line, (str, bytes)) else line
+
 class ConversationRandomSelector(IRandomSelector):
-    def select(self, file: TextIO, lines: int = None, **kwargs) -> Any:
-        all_conversations = []
-        current_conversation = []
+    def select(self, file: BinaryIO, lines: int = None, **kwargs) -> Any:
+        """
+        Picks `lines` conversations uniformly in a single pass (Algorithm R), holding at most
+        `lines` of them in memory, and returns them in their file order.
+        The raw lines are kept, only the lines of the selected conversations are parsed.
+        """
+        reservoir = []
+        randint = random.randint
+        seen = 0
+
+        def offer(conversation):
+            nonlocal seen
+            if lines is None or seen < lines:
+                reservoir.append((seen, conversation))
+            else:
+                slot = randint(0, seen)
+                if slot < lines:
+                    reservoir[slot] = (seen, conversation)
+            seen += 1
 
+        current_conversation = []
         for line in file:
-            line_data = json.loads(line)
-            if line_data.get('role') == 'system' and current_conversation:
-                all_conversations.append(current_conversation)
+            if current_conversation and is_system_line(line):
+                offer(current_conversation)
                 current_conversation = []
 
-            current_conversation.append(line_data)
+            current_conversation.append(line)
 
         if current_conversation:
-            all_conversations.append(current_conversation)
+            offer(current_conversation)
 
-        selected_conversations = random.sample(all_conversations, min(lines, len(all_conversations)))
-        return selected_conversations
+        reservoir.sort(key=itemgetter(0))
+        return [[decode_line(line) for line in conversation] for _, conversation in reservoir]
 
 
 class LineRandomSelector(IRandomSelector):
-    def select(self, file: TextIO, lines: int = None, **kwargs) -> Any:
-        selected_lines = []
-        total_lines = sum(1 for _ in file)
-        file.seek(0)
-        if lines > total_lines:
-            lines = total_lines
-        selected_lines = random.sample(range(total_lines), lines)
-        return selected_lines
+    def select(self, file: BinaryIO, lines: int = None, **kwargs) -> Iterator[Any]:
+        """
+        Picks `lines` lines uniformly in a single pass (reservoir sampling), without counting
+        the lines or seeking back first, and yields them in their file order.
+        """
+        reservoir = []
+        randint = random.randint
+        for index, line in enumerate(file):
+            if index < lines:
+                reservoir.append((index, line))
+            else:
+                slot = randint(0, index)
+                if slot < lines:
+                    reservoir[slot] = (index, line)
+
+        reservoir.sort(key=itemgetter(0))
+        for _, line in reservoir:
+            yield line
+
+
+def line_size(line: Any) -> int:
+    """
+    Returns the size in bytes of a line, without re-encoding bytes or ASCII text.
+    """
+    if isinstance(line, bytes):
+        return len(line)
+    if isinstance(line, str):
+        return len(line) if line.isascii() else len(line.encode('utf-8'))
+    return dumped_size(line)  # Lines already decoded by the reader (CSV, Parquet)
 
 
 class ByteRandomSelector(IRandomSelector):
-    def select(self, file: TextIO, bytes: int = None, **kwargs) -> Any:
+    def select(self, file: BinaryIO, bytes: int = None, **kwargs) -> Any:
         selected_lines = []
         current_bytes = 0
-        current_line = 0
-
-        while current_bytes < bytes:
-            line = file.readline()
-            if not line:
-                break
 
-            line_bytes = len(line.encode('utf-8'))
+        for line in file:
+            line_bytes = line_size(line)
             if current_bytes + line_bytes > bytes:
                 break
 
-            selected_lines.append(current_line)
+            selected_lines.append(line)
             current_bytes += line_bytes
-            current_line += 1
 
-        file.seek(0)
         return selected_lines
-
@@ -0,0 +1,41 @@
+import json
+import math
+
+import pytest
+
+import convector.core  # Imported before convector.utils, which it imports in turn
+from convector.utils.json_utils import loads, dumps
+
+
+def test_loads_nan_row():
+    row = loads(b'{"instruction": "q", "score": NaN, "bound": -Infinity}')
+    assert row["instruction"] == "q"
+    assert math.isnan(row["score"])
+    assert row["bound"] == -math.inf
+
+
+def test_loads_nan_row_from_str():
+    assert math.isnan(loads('{"score": NaN}')["score"])
+
+
+def test_loads_big_int_is_exact():
+    for value in (2 ** 64, 2 ** 70, -(2 ** 63) - 1, 12345678901234567890123):
+        row = loads(f'{{"id": {value}}}'.encode())
+        assert row["id"] == value
+        assert isinstance(row["id"], int)
+
+
+def test_loads_matches_json():
+    line = b'{"id": 9007199254740993, "text": "caf\\u00e9", "nested": {"values": [1, 2.5, null, true]}}'
+    assert loads(line) == json.loads(line)
+
+
+def test_loads_invalid_line_raises():
+    with pytest.raises(ValueError):
+        loads(b'{"id": ')
+
+
+def test_dumps_big_int_round_trip():
+    row = {"id": 2 ** 70, "text": "café"}
+    assert loads(dumps(row)) == row
+    assert dumps(row) == json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8')